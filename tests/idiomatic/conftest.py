@@ -14,8 +14,26 @@
 
 """Fixtures specific to the non-core-side testing."""
 
-from typing import Iterable
+import functools
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
 import pytest
+import pytest_asyncio
 
 from ..conftest import (
     DataAPICredentials,
@@ -28,18 +46,121 @@ from ..conftest import (
 
 from astrapy import AsyncCollection, AsyncDatabase, Collection, DataAPIClient, Database
 from astrapy.constants import VectorMetric
+from astrapy.exceptions import DataAPIResponseException
 
 TEST_COLLECTION_INSTANCE_NAME = "test_coll_instance"
 TEST_COLLECTION_NAME = "id_test_collection"
+TEST_COLLECTION_OPTIONS: Dict[str, Any] = {
+    "dimension": 2,
+    "metric": VectorMetric.COSINE,
+    "indexing": {"deny": ["not_indexed"]},
+}
+
+# Opt-in, for local runs only: keep the test collection across pytest sessions
+# (tracked in the pytest cache). Never on CI, where each run starts from scratch.
+KEEP_TEST_COLLECTION = (
+    os.environ.get("KEEP_TEST_COLLECTION") == "1" and "CI" not in os.environ
+)
+KEPT_COLLECTION_CACHE_KEY = "astrapy/kept_test_collection"
+
+# methods that may leave documents on the collection, or that hand out
+# new collection objects whose writes must be tracked as well
+# (`with_options` goes through `_copy`: the double wrapping is skipped)
+_COLLECTION_WRITE_METHODS = [
+    "insert_one",
+    "insert_many",
+    "update_one",
+    "update_many",
+    "replace_one",
+    "find_one_and_replace",
+    "find_one_and_update",
+    "bulk_write",
+    "command",
+]
+_COLLECTION_DERIVE_METHODS = ["_copy", "with_options", "to_async", "to_sync"]
+_TRACKED_MARKER = "_test_writes_tracked"
+
+T = TypeVar("T")
+
+
+def _track_writes(
+    collection: T,
+    dirty: Dict[str, bool],
+    monkeypatch: Optional[pytest.MonkeyPatch] = None,
+) -> T:
+    """
+    Patch, on the collection instance, all methods that can write documents
+    so that they flag the collection as dirty. Collections derived from this
+    one (copies, async/sync counterparts) are tracked recursively.
+
+    Only the patching of the root collection, done with `monkeypatch`, is
+    undone at teardown: derived collections are new objects owned by
+    the caller, and are patched in place. Already-tracked objects are
+    returned unchanged.
+    """
+    if getattr(collection, _TRACKED_MARKER, False):
+        return collection
+
+    def _patch(name: str, value: Any) -> None:
+        if monkeypatch is not None:
+            monkeypatch.setattr(collection, name, value, raising=False)
+        else:
+            setattr(collection, name, value)
+
+    def _flagging(method: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def _a_flagging(*pargs: Any, **kwargs: Any) -> Any:
+                dirty["v"] = True
+                return await method(*pargs, **kwargs)
+
+            return _a_flagging
+
+        @functools.wraps(method)
+        def _s_flagging(*pargs: Any, **kwargs: Any) -> Any:
+            dirty["v"] = True
+            return method(*pargs, **kwargs)
+
+        return _s_flagging
+
+    def _deriving(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def _s_deriving(*pargs: Any, **kwargs: Any) -> Any:
+            return _track_writes(method(*pargs, **kwargs), dirty)
+
+        return _s_deriving
+
+    for method_name in _COLLECTION_WRITE_METHODS:
+        if hasattr(collection, method_name):
+            _patch(method_name, _flagging(getattr(collection, method_name)))
+    for method_name in _COLLECTION_DERIVE_METHODS:
+        if hasattr(collection, method_name):
+            _patch(method_name, _deriving(getattr(collection, method_name)))
+    _patch(_TRACKED_MARKER, True)
+    return collection
+
+
+def _empty_if_dirty(collection: Collection, dirty: Dict[str, bool]) -> None:
+    if dirty["v"]:
+        collection.delete_many({})
+        dirty["v"] = False
+
+
+# namespaces known to exist, per API endpoint (survives re-runs in one process)
+_existing_namespaces: Dict[str, Set[str]] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(environment: str) -> DataAPIClient:
+    return DataAPIClient(environment=environment)
 
 
 @pytest.fixture(scope="session")
 def client(
     data_api_credentials_info: DataAPICredentialsInfo,
 ) -> Iterable[DataAPIClient]:
-    env = data_api_credentials_info["environment"]
-    client = DataAPIClient(environment=env)
-    yield client
+    yield _get_client(data_api_credentials_info["environment"])
 
 
 @pytest.fixture(scope="session")
@@ -56,78 +177,157 @@ def sync_database(
 
     if not IS_ASTRA_DB:
         # ensure keyspace(s) exist
+        api_endpoint = data_api_credentials_kwargs["api_endpoint"]
         database_admin = database.get_database_admin()
-        database_admin.create_namespace(data_api_credentials_kwargs["namespace"])
+        if api_endpoint not in _existing_namespaces:
+            _existing_namespaces[api_endpoint] = set(database_admin.list_namespaces())
+        existing_namespaces = _existing_namespaces[api_endpoint]
+        namespaces = [data_api_credentials_kwargs["namespace"]]
         if data_api_credentials_info["secondary_namespace"]:
-            database_admin.create_namespace(
-                data_api_credentials_info["secondary_namespace"]
-            )
+            namespaces.append(data_api_credentials_info["secondary_namespace"])
+        missing_namespaces = [ns for ns in namespaces if ns not in existing_namespaces]
+        if missing_namespaces:
+            with ThreadPoolExecutor(max_workers=len(missing_namespaces)) as executor:
+                list(executor.map(database_admin.create_namespace, missing_namespaces))
+            existing_namespaces.update(missing_namespaces)
 
     yield database
 
 
-@pytest.fixture(scope="function")
-def async_database(
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """
+    Run all async tests of this directory in the session-wide event loop,
+    which is also the one of the session-scoped async fixtures below: this way
+    their httpx.AsyncClient connection pools can be shared across tests.
+    """
+    session_scope_marker = pytest.mark.asyncio(scope="session")
+    this_dir = Path(__file__).parent
+    for item in items:
+        if pytest_asyncio.is_async_test(item) and this_dir in item.path.parents:
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_database(
     sync_database: Database,
-) -> Iterable[AsyncDatabase]:
-    yield sync_database.to_async()
+) -> AsyncIterable[AsyncDatabase]:
+    async with sync_database.to_async() as database:
+        yield database
 
 
 @pytest.fixture(scope="session")
 def sync_collection_instance(
-    data_api_credentials_kwargs: DataAPICredentials,
     sync_database: Database,
 ) -> Iterable[Collection]:
     """Just an instance of the class, no DB-level stuff."""
     yield sync_database.get_collection(TEST_COLLECTION_INSTANCE_NAME)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def async_collection_instance(
     sync_collection_instance: Collection,
+    async_database: AsyncDatabase,
 ) -> Iterable[AsyncCollection]:
     """Just an instance of the class, no DB-level stuff."""
-    yield sync_collection_instance.to_async()
+    yield sync_collection_instance.to_async(database=async_database)
+
+
+@pytest.fixture(scope="session")
+def _collection_dirty() -> Dict[str, bool]:
+    """Whether the test collection may contain documents (shared mutable flag)."""
+    return {"v": False}
 
 
 @pytest.fixture(scope="session")
 def sync_collection(
+    request: pytest.FixtureRequest,
     data_api_credentials_kwargs: DataAPICredentials,
     sync_database: Database,
+    _collection_dirty: Dict[str, bool],
 ) -> Iterable[Collection]:
     """An actual collection on DB, in the main namespace"""
-    collection = sync_database.create_collection(
-        TEST_COLLECTION_NAME,
-        dimension=2,
-        metric=VectorMetric.COSINE,
-        indexing={"deny": ["not_indexed"]},
-    )
-    yield collection
+    # the credentials are needed for the endpoint (Database has no public
+    # accessor for it): keying on it avoids reusing a collection kept elsewhere
+    spec_hash = hashlib.sha1(
+        json.dumps(
+            {
+                "api_endpoint": data_api_credentials_kwargs["api_endpoint"],
+                "namespace": sync_database.namespace,
+                "name": TEST_COLLECTION_NAME,
+                **TEST_COLLECTION_OPTIONS,
+            },
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+    cache = getattr(request.config, "cache", None)
+    # either way, a previous session may have left documents around
+    _collection_dirty["v"] = True
+    if (
+        KEEP_TEST_COLLECTION
+        and cache is not None
+        and cache.get(KEPT_COLLECTION_CACHE_KEY, None) == spec_hash
+    ):
+        collection = sync_database.get_collection(TEST_COLLECTION_NAME)
+    else:
+        # a collection kept by an earlier session may still be there (e.g. if
+        # the cache was cleared or the opt-in was just switched off): creation
+        # with the same options is idempotent, while a collection with
+        # different options has to be dropped first
+        try:
+            collection = sync_database.create_collection(
+                TEST_COLLECTION_NAME,
+                **TEST_COLLECTION_OPTIONS,
+                check_exists=False,
+            )
+        except DataAPIResponseException:
+            sync_database.drop_collection(TEST_COLLECTION_NAME)
+            collection = sync_database.create_collection(
+                TEST_COLLECTION_NAME,
+                **TEST_COLLECTION_OPTIONS,
+            )
+        if cache is not None:
+            cache.set(
+                KEPT_COLLECTION_CACHE_KEY,
+                spec_hash if KEEP_TEST_COLLECTION else None,
+            )
+    monkeypatch = pytest.MonkeyPatch()
+    yield _track_writes(collection, _collection_dirty, monkeypatch)
 
-    sync_database.drop_collection(TEST_COLLECTION_NAME)
+    monkeypatch.undo()
+    if not KEEP_TEST_COLLECTION:
+        sync_database.drop_collection(TEST_COLLECTION_NAME)
 
 
 @pytest.fixture(scope="function")
-def sync_empty_collection(sync_collection: Collection) -> Iterable[Collection]:
-    """Emptied for each test function"""
-    sync_collection.delete_many({})
+def sync_empty_collection(
+    sync_collection: Collection,
+    _collection_dirty: Dict[str, bool],
+) -> Iterable[Collection]:
+    """Emptied for each test function (only if a previous test wrote to it)"""
+    _empty_if_dirty(sync_collection, _collection_dirty)
     yield sync_collection
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def async_collection(
     sync_collection: Collection,
+    async_database: AsyncDatabase,
 ) -> Iterable[AsyncCollection]:
     """An actual collection on DB, the same as the sync counterpart"""
-    yield sync_collection.to_async()
+    collection = sync_collection.to_async(database=async_database)
+    # the core collection object builds a new (still unused) HTTP client: have
+    # requests go through the pool of async_database, which closes it at teardown
+    collection._astra_db_collection.client = async_database._astra_db.client
+    yield collection
 
 
 @pytest.fixture(scope="function")
 def async_empty_collection(
     sync_empty_collection: Collection,
+    async_collection: AsyncCollection,
 ) -> Iterable[AsyncCollection]:
-    """Emptied for each test function"""
-    yield sync_empty_collection.to_async()
+    """Emptied for each test function (only if a previous test wrote to it)"""
+    yield async_collection
 
 
 __all__ = [
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import datetime
+import itertools
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
@@ -34,7 +36,38 @@ from astrapy.operations import (
     AsyncDeleteOne,
     AsyncDeleteMany,
 )
-from astrapy.ids import ObjectId, UUID
+from astrapy.ids import ObjectId, UUID, uuid4
+
+# insert_many does not alter the input documents (the _id, if missing, is
+# assigned by the API), hence lists such as this one can be shared by tests
+_FIFTY_A1: List[DocumentType] = [{"a": 1} for _ in range(50)]
+
+# the 16 find_one_and_update cases, identified by a bit string
+# such as "1010" for (return_after, matching, upsert, sort)
+_FOAU_FLAGS = list(itertools.product([False, True], repeat=4))
+
+
+def _foau_case_id(flags: Tuple[bool, ...]) -> str:
+    return "".join(str(int(flag)) for flag in flags)
+
+
+_FOAU_IDS = [_foau_case_id(flags) for flags in _FOAU_FLAGS]
+# these cases share the (non-emptied) collection: their "grp" values carry
+# a per-run suffix, so documents from other tests or earlier runs never match
+_FOAU_RUN = uuid4().hex[:8]
+
+
+async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
+    return [doc async for doc in acursor]
+
+
+async def _assert_count(acol: AsyncCollection, expected: int) -> None:
+    assert await acol.count_documents({}, upper_bound=expected + 1) == expected
+
+
+async def _reset_with(acol: AsyncCollection, documents: List[DocumentType]) -> None:
+    await acol.delete_many({})
+    await acol.insert_many(documents)
 
 
 class TestDMLAsync:
@@ -47,9 +80,13 @@ class TestDMLAsync:
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 0
         )
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 3
@@ -66,9 +103,13 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         count = await async_empty_collection.estimated_document_count()
         # it's _estimated_, no precise expectation with such short sizes/times
         assert isinstance(count, int)
@@ -151,9 +192,13 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 3
@@ -181,9 +226,13 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 3
@@ -196,14 +245,12 @@ class TestDMLAsync:
             == 1
         )
 
-        await async_empty_collection.delete_many({})
-        await async_empty_collection.insert_many([{"a": 1} for _ in range(50)])
+        await _reset_with(async_empty_collection, _FIFTY_A1)
         do_result2 = await async_empty_collection.delete_many({"a": 1})
         assert do_result2.deleted_count == 50
         assert await async_empty_collection.count_documents({}, upper_bound=100) == 0
 
-        await async_empty_collection.delete_many({})
-        await async_empty_collection.insert_many([{"a": 1} for _ in range(50)])
+        await _reset_with(async_empty_collection, _FIFTY_A1)
         do_result2 = await async_empty_collection.delete_many({"a": 1})
         assert do_result2.deleted_count == 50
         assert await async_empty_collection.count_documents({}, upper_bound=100) == 0
@@ -232,9 +279,7 @@ class TestDMLAsync:
     ) -> None:
         await async_empty_collection.insert_many(
             [{"doc": i, "group": "A"} for i in range(50)]
-        )
-        await async_empty_collection.insert_many(
-            [{"doc": i, "group": "B"} for i in range(10)]
+            + [{"doc": i, "group": "B"} for i in range(10)]
         )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
@@ -257,192 +302,47 @@ class TestDMLAsync:
         Nsor = {"seq": SortDocuments.DESCENDING}
         Nfil = {"seq": {"$exists": True}}
 
-        async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
-            return [doc async for doc in acursor]
-
-        # case 0000 of find-pattern matrix
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=None, filter=None
-                    )
-                )
-            )
-            == 30
-        )
-
-        # case 0001
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=None, filter=Nfil
-                    )
-                )
-            )
-            == 30
-        )
-
-        # case 0010
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 0011
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 0100
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=None, filter=None
-                    )
-                )
-            )
-            == 28
-        )
-
-        # case 0101
-        assert (
-            len(
-                await _alist(
+        # the find-pattern matrix: (skip, limit, sort, filter, expected length),
+        # where an expected length of None means the Data API must error.
+        # These are all independent reads, hence issued concurrently.
+        find_cases: List[
+            Tuple[Optional[int], Optional[int], Any, Any, Optional[int]]
+        ] = [
+            (None, None, None, None, 30),  # case 0000
+            (None, None, None, Nfil, 30),  # case 0001
+            (None, None, Nsor, None, 20),  # case 0010, NONPAGINATED
+            (None, None, Nsor, Nfil, 20),  # case 0011, NONPAGINATED
+            (None, Nlim, None, None, 28),  # case 0100
+            (None, Nlim, None, Nfil, 28),  # case 0101
+            (None, Nlim, Nsor, None, 20),  # case 0110, NONPAGINATED
+            (None, Nlim, Nsor, Nfil, 20),  # case 0111, NONPAGINATED
+            (Nski, None, None, None, None),  # case 1000
+            (Nski, None, None, Nfil, None),  # case 1001
+            (Nski, None, Nsor, None, 20),  # case 1010, NONPAGINATED
+            (Nski, None, Nsor, Nfil, 20),  # case 1011, NONPAGINATED
+            (Nski, Nlim, None, None, None),  # case 1100
+            (Nski, Nlim, None, Nfil, None),  # case 1101
+            (Nski, Nlim, Nsor, None, 20),  # case 1110, NONPAGINATED
+            (Nski, Nlim, Nsor, Nfil, 20),  # case 1111, NONPAGINATED
+        ]
+        results = await asyncio.gather(
+            *(
+                _alist(
                     async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=None, filter=Nfil
+                        skip=skip, limit=limit, sort=sort, filter=filter_
                     )
                 )
-            )
-            == 28
+                for skip, limit, sort, filter_, _ in find_cases
+            ),
+            return_exceptions=True,
         )
-
-        # case 0110
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 0111
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1000
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=None, filter=None
-                    )
-                )
-            )
-
-        # case 1001
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=None, filter=Nfil
-                    )
-                )
-            )
-
-        # case 1010
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1011
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1100
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=None, filter=None
-                    )
-                )
-            )
-
-        # case 1101
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=None, filter=Nfil
-                    )
-                )
-            )
-
-        # case 1110
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1111
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
+        for case, result in zip(find_cases, results):
+            expected_len = case[-1]
+            if expected_len is None:
+                assert isinstance(result, DataAPIResponseException), (case, result)
+            else:
+                assert isinstance(result, list), (case, result)
+                assert len(result) == expected_len, case
 
     @pytest.mark.describe("test of cursors from collection.find, async")
     async def test_collection_cursors_async(
@@ -465,9 +365,6 @@ class TestDMLAsync:
         document0b = await cursor0b.__anext__()
         assert "ternary" in document0b
 
-        async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
-            return [doc async for doc in acursor]
-
         # rewinding, slicing and retrieved
         cursor1 = async_empty_collection.find(sort={"seq": 1})
         await cursor1.__anext__()
@@ -513,7 +410,9 @@ class TestDMLAsync:
         # distinct
         cursor5 = async_empty_collection.find()
         dist5 = await cursor5.distinct("ternary")
-        assert (len(await _alist(cursor5))) == 10
+        # distinct works on a copy: checking the untouched position suffices
+        assert cursor5.state == "new"
+        assert cursor5.retrieved == 0
         assert set(dist5) == {0, 1, 2}
         cursor6 = async_empty_collection.find()
         for _ in range(9):
@@ -684,9 +583,6 @@ class TestDMLAsync:
     ) -> None:
         q_vector = [10, 9]
 
-        async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
-            return [doc async for doc in acursor]
-
         # with empty collection
         for include_sv in [False, True]:
             for sort_cl_label in ["reg", "vec"]:
@@ -833,24 +729,30 @@ class TestDMLAsync:
 
         ins_result1 = await acol.insert_many([{"_id": "a"}, {"_id": "b"}], ordered=True)
         assert set(ins_result1.inserted_ids) == {"a", "b"}
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b"}
+        assert {doc["_id"] for doc in await _alist(acol.find())} == {"a", "b"}
 
         with pytest.raises(InsertManyException):
             await acol.insert_many([{"_id": "a"}, {"_id": "c"}], ordered=True)
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b"}
+        assert {doc["_id"] for doc in await _alist(acol.find())} == {"a", "b"}
 
         with pytest.raises(InsertManyException):
             await acol.insert_many(
                 [{"_id": "c"}, {"_id": "a"}, {"_id": "d"}], ordered=True
             )
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b", "c"}
+        assert {doc["_id"] for doc in await _alist(acol.find())} == {"a", "b", "c"}
 
         with pytest.raises(InsertManyException):
             await acol.insert_many(
                 [{"_id": "c"}, {"_id": "d"}, {"_id": "e"}],
                 ordered=False,
             )
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b", "c", "d", "e"}
+        assert {doc["_id"] for doc in await _alist(acol.find())} == {
+            "a",
+            "b",
+            "c",
+            "d",
+            "e",
+        }
 
     @pytest.mark.describe("test of collection insert_many with vectors, async")
     async def test_collection_insert_many_vectors_async(
@@ -901,23 +803,19 @@ class TestDMLAsync:
         Nsor = {"seq": 1}
         Nfil = {"kind": "letter"}
 
-        # case 00 of find-pattern matrix
-        doc00 = await col.find_one(sort=None, filter=None)
+        # cases 00, 01, 10, 11 of find-pattern matrix (independent reads)
+        doc00, doc01, doc10, doc11 = await asyncio.gather(
+            col.find_one(sort=None, filter=None),
+            col.find_one(sort=None, filter=Nfil),
+            col.find_one(sort=Nsor, filter=None),
+            col.find_one(sort=Nsor, filter=Nfil),
+        )
         assert doc00 is not None
         assert doc00["seq"] in {0, 1, 2}
-
-        # case 01
-        doc01 = await col.find_one(sort=None, filter=Nfil)
         assert doc01 is not None
         assert doc01["seq"] in {1, 2}
-
-        # case 10
-        doc10 = await col.find_one(sort=Nsor, filter=None)
         assert doc10 is not None
         assert doc10["seq"] == 0
-
-        # case 11
-        doc11 = await col.find_one(sort=Nsor, filter=Nfil)
         assert doc11 is not None
         assert doc11["seq"] == 1
 
@@ -934,127 +832,134 @@ class TestDMLAsync:
     ) -> None:
         acol = async_empty_collection
 
+        # cases starting from an empty collection: first those not writing...
         resp0000 = await acol.find_one_and_replace({"f": 0}, {"r": 1})
         assert resp0000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
 
         resp0001 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, sort={"x": 1})
         assert resp0001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0010 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, upsert=True)
-        assert resp0010 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp0011 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, sort={"x": 1}
-        )
-        assert resp0011 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0100 = await acol.find_one_and_replace({"f": 0}, {"r": 1})
-        assert resp0100 is not None
-        assert resp0100["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0101 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, sort={"x": 1})
-        assert resp0101 is not None
-        assert resp0101["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0110 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, upsert=True)
-        assert resp0110 is not None
-        assert resp0110["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0111 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, sort={"x": 1}
-        )
-        assert resp0111 is not None
-        assert resp0111["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
 
         resp1000 = await acol.find_one_and_replace(
             {"f": 0}, {"r": 1}, return_document=ReturnDocument.AFTER
         )
         assert resp1000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
 
         resp1001 = await acol.find_one_and_replace(
             {"f": 0}, {"r": 1}, sort={"x": 1}, return_document=ReturnDocument.AFTER
         )
         assert resp1001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
+        await _assert_count(acol, 0)
+
+        # ...then those upserting. Each case tags its filter and replacement
+        # with its own "grp" value, so no reset is needed in between
+        resp0010 = await acol.find_one_and_replace(
+            {"f": 0, "grp": "0010"}, {"r": 1, "grp": "0010"}, upsert=True
+        )
+        assert resp0010 is None
+        await _assert_count(acol, 1)
+
+        resp0011 = await acol.find_one_and_replace(
+            {"f": 0, "grp": "0011"},
+            {"r": 1, "grp": "0011"},
+            upsert=True,
+            sort={"x": 1},
+        )
+        assert resp0011 is None
+        await _assert_count(acol, 2)
 
         resp1010 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, return_document=ReturnDocument.AFTER
+            {"f": 0, "grp": "1010"},
+            {"r": 1, "grp": "1010"},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
         assert resp1010 is not None
         assert resp1010["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
 
         resp1011 = await acol.find_one_and_replace(
-            {"f": 0},
-            {"r": 1},
+            {"f": 0, "grp": "1011"},
+            {"r": 1, "grp": "1011"},
             upsert=True,
             sort={"x": 1},
             return_document=ReturnDocument.AFTER,
         )
         assert resp1011 is not None
         assert resp1011["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
+        await _assert_count(acol, 4)
+
+        # cases finding a match: each consumes its own seeded document
+        await acol.insert_many(
+            [
+                {"f": 0, "grp": grp}
+                for grp in ["0100", "0101", "0110", "0111"]
+                + ["1100", "1101", "1110", "1111"]
+            ]
+        )
+        resp0100 = await acol.find_one_and_replace(
+            {"f": 0, "grp": "0100"}, {"r": 1, "grp": "0100"}
+        )
+        assert resp0100 is not None
+        assert resp0100["f"] == 0
+
+        resp0101 = await acol.find_one_and_replace(
+            {"f": 0, "grp": "0101"}, {"r": 1, "grp": "0101"}, sort={"x": 1}
+        )
+        assert resp0101 is not None
+        assert resp0101["f"] == 0
+
+        resp0110 = await acol.find_one_and_replace(
+            {"f": 0, "grp": "0110"}, {"r": 1, "grp": "0110"}, upsert=True
+        )
+        assert resp0110 is not None
+        assert resp0110["f"] == 0
+
+        resp0111 = await acol.find_one_and_replace(
+            {"f": 0, "grp": "0111"},
+            {"r": 1, "grp": "0111"},
+            upsert=True,
+            sort={"x": 1},
+        )
+        assert resp0111 is not None
+        assert resp0111["f"] == 0
 
-        await acol.insert_one({"f": 0})
         resp1100 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, return_document=ReturnDocument.AFTER
+            {"f": 0, "grp": "1100"},
+            {"r": 1, "grp": "1100"},
+            return_document=ReturnDocument.AFTER,
         )
         assert resp1100 is not None
         assert resp1100["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
 
-        await acol.insert_one({"f": 0})
         resp1101 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, sort={"x": 1}, return_document=ReturnDocument.AFTER
+            {"f": 0, "grp": "1101"},
+            {"r": 1, "grp": "1101"},
+            sort={"x": 1},
+            return_document=ReturnDocument.AFTER,
         )
         assert resp1101 is not None
         assert resp1101["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
 
-        await acol.insert_one({"f": 0})
         resp1110 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, return_document=ReturnDocument.AFTER
+            {"f": 0, "grp": "1110"},
+            {"r": 1, "grp": "1110"},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
         assert resp1110 is not None
         assert resp1110["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
 
-        await acol.insert_one({"f": 0})
         resp1111 = await acol.find_one_and_replace(
-            {"f": 0},
-            {"r": 1},
+            {"f": 0, "grp": "1111"},
+            {"r": 1, "grp": "1111"},
             upsert=True,
             sort={"x": 1},
             return_document=ReturnDocument.AFTER,
         )
         assert resp1111 is not None
         assert resp1111["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
+        # no further upserts happened, and every seeded document got replaced
+        await _assert_count(acol, 12)
+        assert await acol.count_documents({"r": 1}, upper_bound=100) == 12
 
         # projection
         await acol.insert_one({"f": 100, "name": "apple", "mode": "old"})
@@ -1192,8 +1097,10 @@ class TestDMLAsync:
         async_empty_collection: AsyncCollection,
     ) -> None:
         acol = async_empty_collection
-        await acol.insert_many([{"a": 1, "seq": i} for i in range(4)])
-        await acol.insert_many([{"a": 2, "seq": i} for i in range(2)])
+        await acol.insert_many(
+            [{"a": 1, "seq": i} for i in range(4)]
+            + [{"a": 2, "seq": i} for i in range(2)]
+        )
 
         resp1 = await acol.update_many({"a": 1}, {"$set": {"n": 1}})
         assert resp1.update_info["n"] == 4
@@ -1225,8 +1132,10 @@ class TestDMLAsync:
         async_empty_collection: AsyncCollection,
     ) -> None:
         acol = async_empty_collection
-        await acol.insert_many([{"a": 1} for _ in range(50)])
-        await acol.insert_many([{"a": 10} for _ in range(10)])
+        await asyncio.gather(
+            acol.insert_many(_FIFTY_A1),
+            acol.insert_many([{"a": 10} for _ in range(10)]),
+        )
 
         um_result = await acol.update_many({"a": 1}, {"$set": {"b": 2}})
         assert um_result.update_info["n"] == 50
@@ -1234,17 +1143,25 @@ class TestDMLAsync:
         assert um_result.update_info["nModified"] == 50
         assert "upserted" not in um_result.update_info
         assert "upsertedd" not in um_result.update_info
-        assert await acol.count_documents({"b": 2}, upper_bound=100) == 50
-        assert await acol.count_documents({}, upper_bound=100) == 60
+        count_b2, count_all = await asyncio.gather(
+            acol.count_documents({"b": 2}, upper_bound=100),
+            acol.count_documents({}, upper_bound=100),
+        )
+        assert count_b2 == 50
+        assert count_all == 60
 
     @pytest.mark.describe("test of collection find_one_and_delete, async")
     async def test_collection_find_one_and_delete_async(
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 3
@@ -1297,160 +1214,57 @@ class TestDMLAsync:
         assert deleted is not None
         assert deleted["tag"] == "v"
 
+    @pytest.mark.parametrize(
+        ("return_after", "matching", "upsert", "sort"),
+        _FOAU_FLAGS,
+        ids=_FOAU_IDS,
+    )
     @pytest.mark.describe("test of find_one_and_update, async")
     async def test_collection_find_one_and_update_async(
+        self,
+        async_collection: AsyncCollection,
+        return_after: bool,
+        matching: bool,
+        upsert: bool,
+        sort: bool,
+    ) -> None:
+        acol = async_collection
+        case_id = _foau_case_id((return_after, matching, upsert, sort))
+        grp = f"foau_{case_id}_{_FOAU_RUN}"
+        if matching:
+            await acol.insert_one({"f": 0, "grp": grp})
+
+        foau_kwargs: Dict[str, Any] = {}
+        if upsert:
+            foau_kwargs["upsert"] = True
+        if sort:
+            foau_kwargs["sort"] = {"x": 1}
+        if return_after:
+            foau_kwargs["return_document"] = ReturnDocument.AFTER
+        resp = await acol.find_one_and_update(
+            {"f": 0, "grp": grp}, {"$set": {"n": 1}}, **foau_kwargs
+        )
+
+        if matching and not return_after:
+            assert resp is not None
+            assert resp["f"] == 0
+            assert "n" not in resp
+        elif return_after and (matching or upsert):
+            assert resp is not None
+            assert resp["n"] == 1
+        else:
+            assert resp is None
+        assert await acol.count_documents({"grp": grp}, upper_bound=2) == (
+            1 if (matching or upsert) else 0
+        )
+
+    @pytest.mark.describe("test of find_one_and_update with projection, async")
+    async def test_collection_find_one_and_update_projection_async(
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
         acol = async_empty_collection
 
-        resp0000 = await acol.find_one_and_update({"f": 0}, {"$set": {"n": 1}})
-        assert resp0000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0001 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, sort={"x": 1}
-        )
-        assert resp0001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0010 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True
-        )
-        assert resp0010 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp0011 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True, sort={"x": 1}
-        )
-        assert resp0011 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0100 = await acol.find_one_and_update({"f": 0}, {"$set": {"n": 1}})
-        assert resp0100 is not None
-        assert resp0100["f"] == 0
-        assert "n" not in resp0100
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0101 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, sort={"x": 1}
-        )
-        assert resp0101 is not None
-        assert resp0101["f"] == 0
-        assert "n" not in resp0101
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0110 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True
-        )
-        assert resp0110 is not None
-        assert resp0110["f"] == 0
-        assert "n" not in resp0110
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0111 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True, sort={"x": 1}
-        )
-        assert resp0111 is not None
-        assert resp0111["f"] == 0
-        assert "n" not in resp0111
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp1000 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp1001 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp1010 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1010 is not None
-        assert resp1010["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp1011 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1011 is not None
-        assert resp1011["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1100 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1100 is not None
-        assert resp1100["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1101 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1101 is not None
-        assert resp1101["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1110 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1110 is not None
-        assert resp1110["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1111 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1111 is not None
-        assert resp1111["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        # projection
         await acol.insert_one({"f": 100, "name": "apple", "mode": "old"})
         resp_pr1 = await acol.find_one_and_update(
             {"f": 100},
@@ -1499,16 +1313,14 @@ class TestDMLAsync:
         assert bw_result.upserted_count == 1
         assert set(bw_result.upserted_ids.keys()) == {7}
 
-        found_docs = sorted(
-            [doc async for doc in acol.find({})],
-            key=lambda doc: doc.get("seq", 10),
-        )
+        # no sorting needed, the two documents are told apart by their _id
+        found_docs = await _alist(acol.find({}))
         assert len(found_docs) == 2
-        assert found_docs[0]["seq"] == 0
-        assert found_docs[0]["edited"] == 2
-        assert "_id" in found_docs[0]
-        assert len(found_docs[0]) == 3
-        assert found_docs[1] == {"_id": "seq4", "from_upsert": True}
+        assert {"_id": "seq4", "from_upsert": True} in found_docs
+        (seq_doc,) = [doc for doc in found_docs if doc["_id"] != "seq4"]
+        assert seq_doc["seq"] == 0
+        assert seq_doc["edited"] == 2
+        assert len(seq_doc) == 3
 
     @pytest.mark.describe("test of unordered bulk_write, async")
     async def test_collection_unordered_bulk_write_async(
@@ -1532,13 +1344,10 @@ class TestDMLAsync:
         assert bw_u_result.upserted_count == 1
         assert set(bw_u_result.upserted_ids.keys()) == {1}
 
-        found_docs = [doc async for doc in acol.find({})]
-        no_id_found_docs = [
-            {k: v for k, v in doc.items() if k != "_id"} for doc in found_docs
-        ]
-        assert len(no_id_found_docs) == 2
-        assert {"a": 1} in no_id_found_docs
-        assert {"b": 1, "newfield": True} in no_id_found_docs
+        found_docs = await _alist(acol.find({}, projection={"_id": False}))
+        assert len(found_docs) == 2
+        assert {"a": 1} in found_docs
+        assert {"b": 1, "newfield": True} in found_docs
 
     @pytest.mark.describe("test of bulk_write with vectors, async")
     async def test_collection_bulk_write_vector_async(
@@ -1557,10 +1366,9 @@ class TestDMLAsync:
             ]
         with pytest.warns(DeprecationWarning):
             await acol.bulk_write(bw_ops, ordered=True)
-        found = [
-            {k: v for k, v in doc.items() if k != "_id"}
-            async for doc in acol.find({}, projection=["a", "b"])
-        ]
+        found = await _alist(
+            acol.find({}, projection={"_id": False, "a": True, "b": True})
+        )
         assert len(found) == 2
         assert {"a": 10} in found
         assert {"a": 2, "b": 1} in found